@@ -5,7 +5,7 @@ MongoDB helper functions ready to use in your backend code.
 Import and use these functions in your API endpoints for database operations.
 """
 
-from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient
 from datetime import datetime, timezone
 import os
 from dotenv import load_dotenv
@@ -22,34 +22,69 @@ database_url = os.getenv("DATABASE_URL")
 database_name = os.getenv("DATABASE_NAME")
 
 if database_url and database_name:
-    _client = MongoClient(database_url)
+    _client = AsyncIOMotorClient(database_url)
     db = _client[database_name]
 
+# Collection handles bound once at import so requests skip db[...] lookups;
+# the helpers below resolve collection names through this table too
+COLLECTIONS = {}
+if db is not None:
+    COLLECTIONS = {
+        name: db[name] for name in ("user", "session", "trip", "application", "guide", "review", "feedpost")
+    }
+
+USERS = COLLECTIONS.get("user")
+SESSIONS = COLLECTIONS.get("session")
+TRIPS = COLLECTIONS.get("trip")
+GUIDES = COLLECTIONS.get("guide")
+REVIEWS = COLLECTIONS.get("review")
+FEEDPOSTS = COLLECTIONS.get("feedpost")
+
+
+def get_collection(collection_name: str):
+    """Return the cached handle for a collection, binding unknown names once"""
+    collection = COLLECTIONS.get(collection_name)
+    if collection is None:
+        collection = COLLECTIONS[collection_name] = db[collection_name]
+    return collection
+
+
 # Helper functions for common database operations
-def create_document(collection_name: str, data: Union[BaseModel, dict]):
+async def create_document(collection_name: str, data: Union[BaseModel, dict]):
     """Insert a single document with timestamp"""
     if db is None:
         raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
 
     # Convert Pydantic model to dict if needed
     if isinstance(data, BaseModel):
-        data_dict = data.model_dump()
+        data_dict = data.model_dump(mode="json", exclude_none=True)
     else:
         data_dict = data.copy()
 
     data_dict['created_at'] = datetime.now(timezone.utc)
     data_dict['updated_at'] = datetime.now(timezone.utc)
 
-    result = db[collection_name].insert_one(data_dict)
+    result = await get_collection(collection_name).insert_one(data_dict)
     return str(result.inserted_id)
 
-def get_documents(collection_name: str, filter_dict: dict = None, limit: int = None):
-    """Get documents from collection"""
+async def get_documents(collection_name: str, filter_dict: dict = None, limit: int = None, sort: list = None, projection: dict = None):
+    """Get documents from collection, with a string id field in place of _id"""
     if db is None:
         raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
-    
-    cursor = db[collection_name].find(filter_dict or {})
+
+    pipeline = [{"$match": filter_dict or {}}]
+    if sort:
+        pipeline.append({"$sort": dict(sort)})
     if limit:
-        cursor = cursor.limit(limit)
-    
-    return list(cursor)
+        pipeline.append({"$limit": limit})
+    if projection and any(projection.values()):
+        # Inclusion projection: only the requested fields plus the string id
+        pipeline.append({"$project": {**projection, "id": {"$toString": "$_id"}, "_id": 0}})
+    else:
+        # No projection, or an exclusion one whose fields are dropped with _id
+        pipeline.append({"$addFields": {"id": {"$toString": "$_id"}}})
+        pipeline.append({"$project": {**(projection or {}), "_id": 0}})
+
+    # Materialized rather than streamed: callers hash the whole body for an ETag
+    # and cache the list, so nothing could be sent before the last document
+    return await get_collection(collection_name).aggregate(pipeline).to_list(length=limit)
@@ -1,54 +1,298 @@
 import os
+import re
+import asyncio
+import logging
+import time
+import base64
+import hmac
 import hashlib
 import secrets
-from datetime import datetime, timedelta
-from typing import Any, List, Optional
-
-from fastapi import FastAPI, HTTPException, Header, Depends
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, List, Optional
+
+import orjson
+import xxhash
+from bson import ObjectId
+from cachetools import TTLCache
+from fastapi import FastAPI, HTTPException, Header, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from passlib.hash import bcrypt
 from pydantic import BaseModel
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError
+from starlette.concurrency import run_in_threadpool
 
-from database import db, create_document, get_documents
+from database import db, create_document, get_documents, USERS, SESSIONS, TRIPS, GUIDES, FEEDPOSTS
 from schemas import Trip, Application, Guide, Review, FeedPost, UserCreate, UserLogin, UserPublic
 
-app = FastAPI(title="Community Travel Platform API")
+logger = logging.getLogger(__name__)
+
+
+def _orjson_default(obj: Any) -> Any:
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps_json(content: Any) -> bytes:
+    """Encode Mongo documents; naive datetimes from the driver are UTC"""
+    return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NAIVE_UTC)
+
+
+class MongoJSONResponse(ORJSONResponse):
+    """Default response class; only swaps the final encoder for dumps_json.
 
+    FastAPI still runs handler return values through jsonable_encoder first,
+    so Mongo documents (ObjectId, datetimes) must be returned through
+    etag_response, which calls dumps_json directly.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+
+app = FastAPI(title="Community Travel Platform API", default_response_class=MongoJSONResponse)
+
+# Comma-separated list of frontend origins, e.g. "https://app.example.com"
+cors_origins = [o.strip() for o in os.getenv("CORS_ORIGINS", "*").split(",") if o.strip()]
+
+# Auth is a bearer header, not cookies, so credentials stay off and the
+# middleware can answer with static headers
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=cors_origins,
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type", "If-None-Match"],
+    expose_headers=["ETag"],
 )
 
+# Level 1 is enough for repetitive JSON keys; ETags are hashed before this runs
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=1)
+
 
 # -------------------------
 # Helpers
 # -------------------------
 
-def serialize_doc(doc: dict) -> dict:
-    """Convert MongoDB document to JSON-serializable dict"""
-    if not doc:
-        return doc
-    d = dict(doc)
-    if "_id" in d:
-        d["id"] = str(d.pop("_id"))
-    for k, v in list(d.items()):
-        if isinstance(v, datetime):
-            d[k] = v.isoformat()
-    return d
+def _etag_matches(if_none_match: Optional[str], opaque_tag: str) -> bool:
+    """Weak If-None-Match comparison (RFC 9110): W/ is ignored and * matches"""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == opaque_tag:
+            return True
+    return False
+
+
+def etag_response(request: Request, payload: Any) -> Response:
+    """Serialize payload with an ETag; reply 304 if the client's copy is current"""
+    body = dumps_json(payload)
+    opaque_tag = f'"{xxhash.xxh3_64(body).hexdigest()}"'
+    # Weak: GZipMiddleware may re-encode the body, and a strong validator
+    # would have to differ between the gzip and identity codings
+    etag = f"W/{opaque_tag}"
+    if _etag_matches(request.headers.get("if-none-match"), opaque_tag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+# Cost 10 keeps a single verify well under 100 ms on commodity cores
+_bcrypt = bcrypt.using(rounds=10)
+
+# Short-lived email -> user cache so bursts of logins skip the find_one
+_user_by_email_cache: TTLCache = TTLCache(maxsize=1024, ttl=30)
+
+
+def hash_password(password: str) -> str:
+    return _bcrypt.hash(password)
+
+
+def verify_password(password: str, user: dict) -> bool:
+    salt = user.get("password_salt")
+    if salt:
+        # Legacy salted SHA-256 hash from before the switch to bcrypt
+        legacy = hashlib.sha256((salt + password).encode()).hexdigest()
+        return hmac.compare_digest(legacy, user.get("password_hash") or "")
+    try:
+        return _bcrypt.verify(password, user.get("password_hash"))
+    except (ValueError, TypeError):
+        # Missing or non-bcrypt hash on the record
+        return False
+
+
+# Users whose legacy hash is being upgraded by an in-flight login
+_pending_hash_upgrades: set = set()
+
+
+async def _upgrade_legacy_hash(email: str, user: dict, password: str) -> None:
+    """Rehash a legacy SHA-256 user with bcrypt after a successful login"""
+    # Concurrent logins share the cached user dict; only the first upgrades
+    if user["_id"] in _pending_hash_upgrades:
+        return
+    _pending_hash_upgrades.add(user["_id"])
+    try:
+        hashed = await run_in_threadpool(hash_password, password)
+        # Conditional so another worker's upgrade isn't overwritten
+        await USERS.update_one(
+            {"_id": user["_id"], "password_salt": {"$exists": True}},
+            {"$set": {"password_hash": hashed}, "$unset": {"password_salt": ""}},
+        )
+        # Only cache once stored; swap in a new dict rather than mutating the
+        # shared one under readers
+        upgraded = {k: v for k, v in user.items() if k != "password_salt"}
+        upgraded["password_hash"] = hashed
+        _user_by_email_cache[email] = upgraded
+    except Exception:
+        # Opportunistic: the password is already verified, so a failed upgrade
+        # must not fail the login; the next login retries it
+        logger.exception("Could not upgrade legacy password hash for user %s", user["_id"])
+    finally:
+        _pending_hash_upgrades.discard(user["_id"])
+
+
+# Per-collection caches for list endpoints, keyed on the Mongo filter.
+# Writes to a collection clear its cache; other workers catch up within the TTL.
+_list_caches: dict[str, TTLCache] = {
+    "trip": TTLCache(maxsize=256, ttl=30),
+    "guide": TTLCache(maxsize=256, ttl=30),
+    "review": TTLCache(maxsize=256, ttl=30),
+}
+
+
+# Bumped on every clear so a read that overlapped a write doesn't store its
+# pre-write result back into the freshly cleared cache
+_list_generations: dict[str, int] = {name: 0 for name in _list_caches}
+
+
+def invalidate_list(collection_name: str) -> None:
+    _list_caches[collection_name].clear()
+    _list_generations[collection_name] += 1
+
+
+async def cached_list(collection_name: str, filter_dict: dict, limit: int, projection: Optional[dict] = None) -> List[dict]:
+    cache = _list_caches[collection_name]
+    key = orjson.dumps(filter_dict, option=orjson.OPT_SORT_KEYS)
+    docs = cache.get(key)
+    if docs is None:
+        generation = _list_generations[collection_name]
+        docs = await get_documents(collection_name, filter_dict, limit=limit, projection=projection)
+        if _list_generations[collection_name] == generation:
+            cache[key] = docs
+    return docs
+
+
+async def _load_user_by_email(email: str) -> Optional[dict]:
+    user = _user_by_email_cache.get(email)
+    if user is None:
+        user = await USERS.find_one({"email": email})
+        if user:
+            _user_by_email_cache[email] = user
+    return user
+
+
+# Every worker must sign with the same AUTH_SECRET. A random per-process key
+# is only allowed when AUTH_DEV_RANDOM_SECRET=1 (start_server.sh sets it).
+AUTH_SECRET = os.getenv("AUTH_SECRET", "").encode()
+if not AUTH_SECRET:
+    if os.getenv("AUTH_DEV_RANDOM_SECRET") != "1":
+        raise RuntimeError(
+            "AUTH_SECRET is not set. Set it to a secret shared by all workers, "
+            "or set AUTH_DEV_RANDOM_SECRET=1 for a single-process dev server."
+        )
+    AUTH_SECRET = secrets.token_bytes(32)
+    logger.warning(
+        "AUTH_SECRET is not set; signing tokens with a random per-process key "
+        "(AUTH_DEV_RANDOM_SECRET=1). Tokens will not survive a restart."
+    )
+TOKEN_TTL = timedelta(days=7)
+
+# Authenticated requests resolve the user from here before hitting Mongo
+_user_by_id_cache: TTLCache = TTLCache(maxsize=4096, ttl=30)
+
+
+def _sign(message: str) -> str:
+    digest = hmac.new(AUTH_SECRET, message.encode(), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
 
+def issue_token(user_id: ObjectId) -> str:
+    """Stateless bearer token of the form <user_id>.<exp>.<hmac>"""
+    exp = int((datetime.now(timezone.utc) + TOKEN_TTL).timestamp())
+    message = f"{user_id}.{exp}"
+    return f"{message}.{_sign(message)}"
 
-def serialize_list(docs: List[dict]) -> List[dict]:
-    return [serialize_doc(d) for d in docs]
 
+def verify_token(token: str) -> Optional[str]:
+    """Return the user id of a valid, unexpired token"""
+    try:
+        user_id, exp, sig = token.split(".")
+    except ValueError:
+        return None
+    # Compare bytes: compare_digest rejects non-ASCII str, and headers are latin-1
+    if not hmac.compare_digest(sig.encode(), _sign(f"{user_id}.{exp}").encode()):
+        return None
+    if not (exp.isascii() and exp.isdigit()) or int(exp) < time.time():
+        return None
+    return user_id
+
+
+async def _load_user_by_id(user_id: str) -> Optional[dict]:
+    user = _user_by_id_cache.get(user_id)
+    if user is None:
+        user = await USERS.find_one({"_id": ObjectId(user_id)})
+        if user:
+            _user_by_id_cache[user_id] = user
+    return user
+
+
+# -------------------------
+# Startup
+# -------------------------
 
-def hash_password(password: str, salt: Optional[str] = None) -> tuple[str, str]:
-    import hashlib as _hashlib
-    import secrets as _secrets
-    salt = salt or _secrets.token_hex(16)
-    hashed = _hashlib.sha256((salt + password).encode()).hexdigest()
-    return hashed, salt
+async def _startup_step(description: str, op: Awaitable) -> None:
+    # A failed step is logged, not raised, so DB trouble degrades the API
+    # (and shows up on /test) instead of keeping it from booting
+    try:
+        await op
+    except Exception:
+        logger.exception("Startup: could not %s", description)
+
+
+async def _backfill_guide_location_lc():
+    # Lowercase in Python like create_guide does; Mongo's $toLower is ASCII-only
+    updates = [
+        UpdateOne({"_id": guide["_id"]}, {"$set": {"location_lc": (guide.get("location") or "").lower()}})
+        async for guide in GUIDES.find({"location_lc": {"$exists": False}}, {"location": 1})
+    ]
+    if updates:
+        await GUIDES.bulk_write(updates, ordered=False)
+    await GUIDES.create_index("location_lc")
+
+
+@app.on_event("startup")
+async def prepare_database():
+    if db is None:
+        return
+    # Run concurrently so an unreachable server costs one selection timeout
+    await asyncio.gather(
+        _startup_step("index feedpost.created_at", FEEDPOSTS.create_index([("created_at", -1)])),
+        # Covers tag-filtered feeds, already in created_at order
+        _startup_step("index feedpost.tags", FEEDPOSTS.create_index([("tags", 1), ("created_at", -1)])),
+        _startup_step("index trip.tags", TRIPS.create_index("tags")),
+        _startup_step("index guide.expertise", GUIDES.create_index("expertise")),
+        _startup_step("create unique index on user.email", USERS.create_index("email", unique=True)),
+        # Tokens are stateless now; sessions left from opaque tokens expire via TTL
+        _startup_step("index session.expires_at", SESSIONS.create_index("expires_at", expireAfterSeconds=0)),
+        # Backfill the lowercased location used by the guide search
+        _startup_step("backfill guide.location_lc", _backfill_guide_location_lc()),
+    )
 
 
 # -------------------------
@@ -56,12 +300,12 @@ def hash_password(password: str, salt: Optional[str] = None) -> tuple[str, str]:
 # -------------------------
 
 @app.get("/")
-def read_root():
+async def read_root():
     return {"message": "Community Travel Platform API running"}
 
 
 @app.get("/test")
-def test_database():
+async def test_database():
     response = {
         "backend": "✅ Running",
         "database": "❌ Not Available",
@@ -77,7 +321,7 @@ def test_database():
             response["database_name"] = db.name if hasattr(db, "name") else "Unknown"
             response["connection_status"] = "Connected"
             try:
-                collections = db.list_collection_names()
+                collections = await db.list_collection_names()
                 response["collections"] = collections[:10]
                 response["database"] = "✅ Connected & Working"
             except Exception as e:
@@ -99,30 +343,26 @@ class AuthResponse(BaseModel):
 
 
 @app.post("/auth/register", response_model=AuthResponse)
-def register(payload: UserCreate):
+async def register(payload: UserCreate):
     try:
-        existing = db["user"].find_one({"email": payload.email})
+        existing = await USERS.find_one({"email": payload.email})
         if existing:
             raise HTTPException(status_code=400, detail="Email already registered")
-        hashed, salt = hash_password(payload.password)
+        hashed = await run_in_threadpool(hash_password, payload.password)
         user_doc = {
             "name": payload.name,
             "email": str(payload.email),
             "password_hash": hashed,
-            "password_salt": salt,
             "avatar_url": None,
             "created_at": datetime.utcnow(),
             "updated_at": datetime.utcnow(),
         }
-        user_id = db["user"].insert_one(user_doc).inserted_id
-        token = secrets.token_urlsafe(32)
-        session_doc = {
-            "user_id": str(user_id),
-            "token": token,
-            "created_at": datetime.utcnow(),
-            "expires_at": datetime.utcnow() + timedelta(days=7),
-        }
-        db["session"].insert_one(session_doc)
+        try:
+            user_id = (await USERS.insert_one(user_doc)).inserted_id
+        except DuplicateKeyError:
+            # Lost a race with a concurrent registration of the same email
+            raise HTTPException(status_code=400, detail="Email already registered")
+        token = issue_token(user_id)
         user_public = UserPublic(id=str(user_id), name=user_doc["name"], email=user_doc["email"], avatar_url=None)
         return {"token": token, "user": user_public}
     except HTTPException:
@@ -132,22 +372,16 @@ def register(payload: UserCreate):
 
 
 @app.post("/auth/login", response_model=AuthResponse)
-def login(payload: UserLogin):
+async def login(payload: UserLogin):
     try:
-        user = db["user"].find_one({"email": str(payload.email)})
+        user = await _load_user_by_email(str(payload.email))
         if not user:
             raise HTTPException(status_code=401, detail="Invalid credentials")
-        hashed, _ = hash_password(payload.password, user.get("password_salt"))
-        if hashed != user.get("password_hash"):
+        if not await run_in_threadpool(verify_password, payload.password, user):
             raise HTTPException(status_code=401, detail="Invalid credentials")
-        token = secrets.token_urlsafe(32)
-        session_doc = {
-            "user_id": str(user["_id"]),
-            "token": token,
-            "created_at": datetime.utcnow(),
-            "expires_at": datetime.utcnow() + timedelta(days=7),
-        }
-        db["session"].insert_one(session_doc)
+        if user.get("password_salt"):
+            await _upgrade_legacy_hash(str(payload.email), user, payload.password)
+        token = issue_token(user["_id"])
         user_public = UserPublic(id=str(user["_id"]), name=user.get("name"), email=user.get("email"), avatar_url=user.get("avatar_url"))
         return {"token": token, "user": user_public}
     except HTTPException:
@@ -156,7 +390,7 @@ def login(payload: UserLogin):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def get_current_user(authorization: Optional[str] = Header(None)) -> dict:
+async def get_current_user(authorization: Optional[str] = Header(None)) -> dict:
     if not authorization:
         raise HTTPException(status_code=401, detail="Missing Authorization header")
     try:
@@ -165,21 +399,17 @@ def get_current_user(authorization: Optional[str] = Header(None)) -> dict:
         raise HTTPException(status_code=401, detail="Invalid Authorization header")
     if scheme.lower() != "bearer":
         raise HTTPException(status_code=401, detail="Invalid auth scheme")
-    session = db["session"].find_one({"token": token})
-    if not session:
+    user_id = verify_token(token)
+    if not user_id:
         raise HTTPException(status_code=401, detail="Invalid token")
-    from bson import ObjectId
-    try:
-        user = db["user"].find_one({"_id": ObjectId(session.get("user_id"))})
-    except Exception:
-        user = None
+    user = await _load_user_by_id(user_id)
     if not user:
         raise HTTPException(status_code=401, detail="User not found for token")
     return user
 
 
 @app.get("/auth/me", response_model=UserPublic)
-def me(user: dict = Depends(get_current_user)):
+async def me(user: dict = Depends(get_current_user)):
     return UserPublic(id=str(user["_id"]), name=user.get("name"), email=user.get("email"), avatar_url=user.get("avatar_url"))
 
 
@@ -187,33 +417,63 @@ def me(user: dict = Depends(get_current_user)):
 # Trips
 # -------------------------
 
+# Listing fields only; the free-text itinerary is left for the detail view
+TRIP_LIST_FIELDS = {
+    "title": 1,
+    "destination": 1,
+    "start_date": 1,
+    "end_date": 1,
+    "budget_estimate": 1,
+    "needed_members": 1,
+    "capacity": 1,
+    "tags": 1,
+    "organizer_id": 1,
+    "status": 1,
+}
+
+
 @app.post("/api/trips")
-def create_trip(trip: Trip):
+async def create_trip(trip: Trip):
     try:
-        trip_id = create_document("trip", trip)
+        trip_id = await create_document("trip", trip)
+        invalidate_list("trip")
         return {"id": trip_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/trips")
-def list_trips(tag: str | None = None):
+async def list_trips(request: Request, tag: str | None = None):
     try:
         filter_dict: dict[str, Any] = {}
         if tag:
-            filter_dict["tags"] = {"$in": [tag]}
-        docs = get_documents("trip", filter_dict, limit=100)
-        return serialize_list(docs)
+            filter_dict["tags"] = tag
+        docs = await cached_list("trip", filter_dict, limit=100, projection=TRIP_LIST_FIELDS)
+        return etag_response(request, docs)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/trips/{trip_id}")
+async def get_trip(request: Request, trip_id: str):
+    if not ObjectId.is_valid(trip_id):
+        raise HTTPException(status_code=404, detail="Trip not found")
+    try:
+        docs = await get_documents("trip", {"_id": ObjectId(trip_id)}, limit=1)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    if not docs:
+        raise HTTPException(status_code=404, detail="Trip not found")
+    # Same encoder as the listing, so timestamps come back in one format
+    return etag_response(request, docs[0])
+
+
 @app.post("/api/trips/{trip_id}/apply")
-def apply_to_trip(trip_id: str, application: Application):
+async def apply_to_trip(trip_id: str, application: Application):
     try:
-        data = application.model_dump()
+        data = application.model_dump(mode="json", exclude_none=True)
         data["trip_id"] = trip_id
-        app_id = create_document("application", data)
+        app_id = await create_document("application", data)
         return {"id": app_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -223,43 +483,52 @@ def apply_to_trip(trip_id: str, application: Application):
 # Guides & Reviews
 # -------------------------
 
+# location_lc only backs the search index; clients get location as entered
+GUIDE_LIST_EXCLUDE = {"location_lc": 0}
+
+
 @app.post("/api/guides")
-def create_guide(guide: Guide):
+async def create_guide(guide: Guide):
     try:
-        guide_id = create_document("guide", guide)
+        data = guide.model_dump(mode="json", exclude_none=True)
+        data["location_lc"] = guide.location.lower()
+        guide_id = await create_document("guide", data)
+        invalidate_list("guide")
         return {"id": guide_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/guides")
-def list_guides(location: str | None = None, expertise: str | None = None):
+async def list_guides(request: Request, location: str | None = None, expertise: str | None = None):
     try:
         filter_dict: dict[str, Any] = {}
         if location:
-            filter_dict["location"] = {"$regex": location, "$options": "i"}
+            # Anchored prefix on the lowercased copy so the index can be used
+            filter_dict["location_lc"] = {"$regex": "^" + re.escape(location.lower())}
         if expertise:
-            filter_dict["expertise"] = {"$in": [expertise]}
-        docs = get_documents("guide", filter_dict, limit=100)
-        return serialize_list(docs)
+            filter_dict["expertise"] = expertise
+        docs = await cached_list("guide", filter_dict, limit=100, projection=GUIDE_LIST_EXCLUDE)
+        return etag_response(request, docs)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/reviews")
-def create_review(review: Review):
+async def create_review(review: Review):
     try:
-        review_id = create_document("review", review)
+        review_id = await create_document("review", review)
+        invalidate_list("review")
         return {"id": review_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/guides/{guide_id}/reviews")
-def list_reviews_for_guide(guide_id: str):
+async def list_reviews_for_guide(request: Request, guide_id: str):
     try:
-        docs = get_documents("review", {"guide_id": guide_id}, limit=100)
-        return serialize_list(docs)
+        docs = await cached_list("review", {"guide_id": guide_id}, limit=100)
+        return etag_response(request, docs)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -268,24 +537,27 @@ def list_reviews_for_guide(guide_id: str):
 # Community Feed
 # -------------------------
 
+# Built from the schema so new FeedPost fields show up in the feed automatically
+FEED_FIELDS = {**{name: 1 for name in FeedPost.model_fields}, "created_at": 1}
+
+
 @app.post("/api/feed")
-def create_feed_post(post: FeedPost):
+async def create_feed_post(post: FeedPost):
     try:
-        post_id = create_document("feedpost", post)
+        post_id = await create_document("feedpost", post)
         return {"id": post_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/feed")
-def list_feed(tag: str | None = None):
+async def list_feed(request: Request, tag: str | None = None):
     try:
         filter_dict: dict[str, Any] = {}
         if tag:
-            filter_dict["tags"] = {"$in": [tag]}
-        docs = get_documents("feedpost", filter_dict, limit=50)
-        docs.sort(key=lambda d: d.get("created_at", datetime.min), reverse=True)
-        return serialize_list(docs)
+            filter_dict["tags"] = tag
+        docs = await get_documents("feedpost", filter_dict, limit=50, sort=[("created_at", -1)], projection=FEED_FIELDS)
+        return etag_response(request, docs)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -293,4 +565,5 @@ def list_feed(tag: str | None = None):
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Single-process dev server; in production run under gunicorn (see README)
+    uvicorn.run("main:app", host="0.0.0.0", port=port, loop="uvloop", http="httptools")
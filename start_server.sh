@@ -15,5 +15,7 @@ mkdir -p logs
 echo "Installing dependencies..."
 pip install -r requirements.txt
 echo "Starting FastAPI server..."
-nohup uvicorn main:app --host 0.0.0.0 --port 8000 --reload > logs/server.log 2>&1 
+# Single dev process: sign tokens with a throwaway key unless AUTH_SECRET is set
+export AUTH_DEV_RANDOM_SECRET=1
+nohup uvicorn main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools --reload > logs/server.log 2>&1 
 echo "Server started in background"